@@ -0,0 +1,224 @@
+#  Copyright 2021 Victor Guimarães
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Handles a columnar representation of the atoms of a knowledge base.
+"""
+from typing import Dict, List
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+from neurallog.language.language import Atom, Predicate, Term
+
+ABSENT_TERM = -1
+
+
+def match_rows(predicate_ids, term_ids, predicate_id, constant_positions,
+               constant_ids, variable_positions, bound_positions, out):
+    """
+    Marks, in `out`, the rows of the table that match the predicate, the
+    constants and the repeated variables of an atom, one row at a time.
+    This is the kernel compiled by Numba, if it is installed.
+
+    :param predicate_ids: the predicate id of each row
+    :type predicate_ids: np.ndarray
+    :param term_ids: the term ids of each row
+    :type term_ids: np.ndarray
+    :param predicate_id: the id of the predicate of the atom
+    :type predicate_id: int
+    :param constant_positions: the positions of the constants of the atom
+    :type constant_positions: np.ndarray
+    :param constant_ids: the ids of the constants of the atom
+    :type constant_ids: np.ndarray
+    :param variable_positions: the positions of the repeated variables
+    :type variable_positions: np.ndarray
+    :param bound_positions: the first position of each repeated variable
+    :type bound_positions: np.ndarray
+    :param out: the array to store the matches
+    :type out: np.ndarray
+    """
+    for i in prange(predicate_ids.shape[0]):
+        if predicate_ids[i] != predicate_id:
+            out[i] = False
+            continue
+        matches = True
+        for k in range(constant_positions.shape[0]):
+            if term_ids[i, constant_positions[k]] != constant_ids[k]:
+                matches = False
+                break
+        if matches:
+            for k in range(variable_positions.shape[0]):
+                if term_ids[i, variable_positions[k]] != \
+                        term_ids[i, bound_positions[k]]:
+                    matches = False
+                    break
+        out[i] = matches
+
+
+def match_columns(predicate_ids, term_ids, predicate_id, constant_positions,
+                  constant_ids, variable_positions, bound_positions, out):
+    """
+    Marks, in `out`, the rows of the table that match the predicate, the
+    constants and the repeated variables of an atom, by combining a NumPy
+    mask per column. This is the kernel used if Numba is not installed.
+
+    The parameters are the same as the ones of `match_rows`.
+    """
+    mask = predicate_ids == predicate_id
+    for position, constant_id in zip(constant_positions, constant_ids):
+        mask &= term_ids[:, position] == constant_id
+    for position, bound_position in zip(variable_positions, bound_positions):
+        mask &= term_ids[:, position] == term_ids[:, bound_position]
+    out[:] = mask
+
+
+match_kernel = \
+    match_columns if njit is None else njit(parallel=True)(match_rows)
+"""
+The kernel to match the rows of the table: `match_rows` compiled by Numba, if
+it is installed; otherwise, `match_columns`.
+"""
+
+
+class KnowledgeBaseTable:
+    """
+    Represents a set of atoms as columns of integers, in order to quickly
+    find the atoms that unify with a given atom.
+
+    Each predicate and each term is mapped to an integer id. The i-th atom is
+    stored as the id of its predicate, in `predicate_ids[i]`, and the ids of
+    its terms, in `term_ids[i]`. The positions beyond the arity of the atom
+    are filled with `ABSENT_TERM`.
+    """
+
+    def __init__(self, atoms=()):
+        """
+        Creates a knowledge base table.
+
+        :param atoms: the atoms
+        :type atoms: collections.Iterable[Atom]
+        """
+        self.atoms: List[Atom] = list(atoms)
+        self.predicates: List[Predicate] = []
+        self.predicate_index: Dict[Predicate, int] = dict()
+        self.terms: List[Term] = []
+        self.term_index: Dict[Term, int] = dict()
+
+        max_arity = max(map(lambda x: x.arity(), self.atoms), default=0)
+        self.predicate_ids = np.empty(len(self.atoms), dtype=np.int32)
+        self.term_ids = np.full((len(self.atoms), max_arity), ABSENT_TERM,
+                                dtype=np.int32)
+        for i, atom in enumerate(self.atoms):
+            self.predicate_ids[i] = self._get_id(
+                atom.predicate, self.predicates, self.predicate_index)
+            for j, term in enumerate(atom.terms):
+                self.term_ids[i, j] = \
+                    self._get_id(term, self.terms, self.term_index)
+
+    @classmethod
+    def to_table(cls, atoms):
+        """
+        Builds a knowledge base table from the atoms.
+
+        :param atoms: the atoms
+        :type atoms: collections.Iterable[Atom]
+        :return: the knowledge base table
+        :rtype: KnowledgeBaseTable
+        """
+        return cls(atoms)
+
+    @staticmethod
+    def _get_id(value, values, index):
+        """
+        Gets the id of `value`, assigning a new id if `value` has none.
+
+        :param value: the value
+        :type value: Predicate or Term
+        :param values: the values, by id
+        :type values: List[Predicate or Term]
+        :param index: the ids, by value
+        :type index: Dict[Predicate or Term, int]
+        :return: the id of the value
+        :rtype: int
+        """
+        value_id = index.get(value)
+        if value_id is None:
+            value_id = len(values)
+            index[value] = value_id
+            values.append(value)
+        return value_id
+
+    def match_mask(self, generic_atom):
+        """
+        Gets a mask of the atoms that unify with `generic_atom`. This is,
+        the atoms for which `get_substitution(generic_atom, atom)` is not
+        `None`.
+
+        :param generic_atom: the generic atom
+        :type generic_atom: Atom
+        :return: the mask of the atoms that unify with `generic_atom`
+        :rtype: np.ndarray
+        """
+        predicate_id = self.predicate_index.get(generic_atom.predicate)
+        if predicate_id is None:
+            return np.zeros(len(self.atoms), dtype=bool)
+
+        constant_positions = []
+        constant_ids = []
+        variable_positions = []
+        bound_positions = []
+        first_positions = dict()
+        for i, term in enumerate(generic_atom.terms):
+            if term.is_constant():
+                term_id = self.term_index.get(term)
+                if term_id is None:
+                    return np.zeros(len(self.atoms), dtype=bool)
+                constant_positions.append(i)
+                constant_ids.append(term_id)
+            else:
+                position = first_positions.setdefault(term, i)
+                if position != i:
+                    variable_positions.append(i)
+                    bound_positions.append(position)
+
+        mask = np.empty(len(self.atoms), dtype=bool)
+        match_kernel(
+            self.predicate_ids, self.term_ids, predicate_id,
+            np.array(constant_positions, dtype=np.int64),
+            np.array(constant_ids, dtype=np.int32),
+            np.array(variable_positions, dtype=np.int64),
+            np.array(bound_positions, dtype=np.int64),
+            mask)
+        return mask
+
+    def match(self, generic_atom):
+        """
+        Gets the atoms that unify with `generic_atom`.
+
+        :param generic_atom: the generic atom
+        :type generic_atom: Atom
+        :return: the atoms that unify with `generic_atom`
+        :rtype: List[Atom]
+        """
+        return [self.atoms[i]
+                for i in np.flatnonzero(self.match_mask(generic_atom))]
+
+    def __len__(self):
+        return len(self.atoms)
@@ -115,7 +115,7 @@ class EquivalentClauseAtom(EquivalentAtom):
         """
         super().__init__(atom, fixed_terms)
         self.body = body
-        self._hash = self._compute_hash()
+        self._clause_hash_code = self._compute_hash()
 
     def _compute_hash(self):
         _hash = super().__hash__()
@@ -123,7 +123,7 @@ class EquivalentClauseAtom(EquivalentAtom):
         return _hash
 
     def __hash__(self):
-        return self._hash
+        return self._clause_hash_code
 
     def __eq__(self, other):
         if id(self) == id(other):
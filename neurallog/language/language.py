@@ -19,6 +19,8 @@ Define the classes to represent the knowledge of the system.
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Collection
+from functools import lru_cache
+from itertools import chain
 
 TRAINABLE_KEY = "$"
 
@@ -40,16 +42,37 @@ def get_term_from_string(string):
     :return: the term
     :rtype: Term
     """
-    if string[0].isupper():
+    first = string[0]
+    # compares ASCII characters directly, before resorting to the Unicode
+    # aware `isupper` and `islower`
+    if "A" <= first <= "Z":
         return Variable(string)
-    elif string[0].islower() or string[0] == "_":
+    elif "a" <= first <= "z" or first == "_":
         return Constant(string)
-    elif string[0] == string[-1] and (string[0] == "'" or string[0] == '"'):
+    elif first == string[-1] and (first == "'" or first == '"'):
         return Quote(string)
+    elif first.isupper():
+        return Variable(string)
+    elif first.islower():
+        return Constant(string)
     else:
         raise TermMalformedException()
 
 
+@lru_cache(maxsize=8192)
+def _quote_is_template(value):
+    """
+    Checks if the quoted value contains a place holder. Most quoted values
+    do not contain a `{`, so we test it before resorting to the regex.
+
+    :param value: the quoted value
+    :type value: str
+    :return: True if the value contains a place holder, False otherwise
+    :rtype: bool
+    """
+    return "{" in value and PLACE_HOLDER.search(value) is not None
+
+
 def get_constant_from_string(string):
     """
     Transforms the string into a constant term.
@@ -80,6 +103,10 @@ def build_terms(arguments):
     for argument in arguments:
         if isinstance(argument, Term):
             terms.append(argument)
+            continue
+        builder = TERM_BUILDERS.get(type(argument))
+        if builder is not None:
+            terms.append(builder(argument))
         elif isinstance(argument, str):
             terms.append(get_term_from_string(argument))
         elif isinstance(argument, float) or isinstance(argument, int):
@@ -90,6 +117,25 @@ def build_terms(arguments):
     return terms
 
 
+_RENAMED_VARIABLES = []
+
+
+def get_renamed_variable(index):
+    """
+    Gets the positional variable of `index`, used to rename the variables of
+    atoms. The variables are built once and reused.
+
+    :param index: the index of the variable
+    :type index: int
+    :return: the variable
+    :rtype: Variable
+    """
+    while len(_RENAMED_VARIABLES) <= index:
+        _RENAMED_VARIABLES.append(
+            Variable("X{}".format(len(_RENAMED_VARIABLES))))
+    return _RENAMED_VARIABLES[index]
+
+
 def get_variable_atom(value):
     """
     Gets an atom or literal by replacing their constant for unique variables.
@@ -103,7 +149,7 @@ def get_variable_atom(value):
         predicate = value.predicate
     else:
         predicate = value
-    terms = [Variable("X{}".format(i)) for i in range(predicate.arity)]
+    terms = [get_renamed_variable(i) for i in range(predicate.arity)]
     variable_atom = Atom(predicate, *terms)
     if isinstance(value, Literal):
         return Literal(variable_atom, negated=value.negated)
@@ -116,26 +162,45 @@ def get_renamed_atom(atom):
     In this way, atoms with different variable names will have the same key,
     as long as the number of variables and their positions matches.
 
+    The renamed atom is cached in `atom` itself, rather than looked up by
+    equality, since equal atoms might have terms of different types, e.g.
+    `1` and `1.0`. As such, the returned atom must not be modified.
+
+    :param atom: the atom
+    :type atom: Atom
+    :return: the renamed atom
+    :rtype: Atom
+    """
+    renamed_atom = atom._renamed_atom
+    if renamed_atom is None:
+        renamed_atom = _compute_renamed_atom(atom)
+        atom._renamed_atom = renamed_atom
+    return renamed_atom
+
+
+def _compute_renamed_atom(atom):
+    """
+    Computes the renamed atom of `atom`.
+
     :param atom: the atom
     :type atom: Atom
     :return: the renamed atom
     :rtype: Atom
     """
     terms = []
-    index = 0
     term_map = dict()
     for term in atom.terms:
-        if term.is_constant():
-            if isinstance(term, Quote):
-                terms.append(Constant(term.value))
-            else:
-                terms.append(term)
+        if not term.is_constant():
+            renamed_term = term_map.get(term)
+            if renamed_term is None:
+                renamed_term = get_renamed_variable(len(term_map))
+                term_map[term] = renamed_term
+            terms.append(renamed_term)
+        elif isinstance(term, Quote):
+            terms.append(Constant(term.value))
         else:
-            if term not in term_map:
-                term_map[term] = "X{}".format(index)
-                index += 1
-            terms.append(term_map[term])
-    return Atom(atom.predicate, *terms)
+            terms.append(term)
+    return Atom._from_validated(atom.predicate, tuple(terms))
 
 
 def get_renamed_literal(literal):
@@ -171,18 +236,14 @@ def get_substitution(generic_atom, specific_atom):
         return None
 
     substitutions = dict()
-    for i in range(generic_atom.arity()):
-        generic_term = generic_atom.terms[i]
-        specific_term = specific_atom.terms[i]
-
+    for generic_term, specific_term in \
+            zip(generic_atom.terms, specific_atom.terms):
         if generic_term.is_constant() and generic_term != specific_term:
             return None
-        else:
-            substitution = substitutions.get(generic_term, None)
-            if substitution is None:
-                substitutions[generic_term] = specific_term
-            elif substitution != specific_term:
-                return None
+        substitution = substitutions.setdefault(generic_term, specific_term)
+        if substitution is not specific_term and \
+                substitution != specific_term:
+            return None
 
     return substitutions
 
@@ -224,10 +285,9 @@ class TooManyArgumentsFunction(KnowledgeException):
         :param predicate: the predicate
         :type predicate: Predicate
         """
-        super().__init__("Too many arguments for function predicate {} at "
-                         "The maximum number of arguments allowed is {}."
-                         .format(predicate,
-                                 self.MAX_NUMBER_OF_ARGUMENTS))
+        super().__init__(f"Too many arguments for function predicate "
+                         f"{predicate} at The maximum number of arguments "
+                         f"allowed is {self.MAX_NUMBER_OF_ARGUMENTS}.")
 
 
 class AtomMalformedException(KnowledgeException):
@@ -337,6 +397,8 @@ class Term:
     Represents a logic term.
     """
 
+    __slots__ = ("value", "_hash")
+
     def __init__(self, value):
         """
         Creates a logic term.
@@ -345,6 +407,7 @@ class Term:
         :type value: Any
         """
         self.value = value
+        self._hash = None
 
     def get_name(self):
         """
@@ -381,12 +444,19 @@ class Term:
         return self.value,
 
     def __hash__(self):
-        return hash(self.key())
+        # the hash is computed on first use, since most terms built while
+        # loading the knowledge base are never hashed
+        if self._hash is None:
+            self._hash = hash(self.key())
+        return self._hash
 
     def __eq__(self, other):
-        if isinstance(other, Term):
+        if self is other:
+            return True
+        try:
             return self.key() == other.key()
-        return False
+        except AttributeError:
+            return NotImplemented
 
     def __gt__(self, other):
         return self.key() > other.key()
@@ -397,7 +467,10 @@ class Term:
     def __lt__(self, other):
         self_key = self.key()
         other_key = other.key()
-        return (len(self_key),) + self_key < (len(other_key),) + other_key
+        # the length of the key orders constants before variables
+        if len(self_key) != len(other_key):
+            return len(self_key) < len(other_key)
+        return self_key < other_key
 
     def __le__(self, other):
         return self.key() <= other.key()
@@ -411,6 +484,8 @@ class Constant(Term):
     Represents a logic constant.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
         """
         Creates a logic constant.
@@ -433,6 +508,8 @@ class Variable(Term):
     Represents a logic variable.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
         """
         Creates a logic variable.
@@ -456,6 +533,8 @@ class Quote(Term):
     Represents a quoted term, that might contain a template.
     """
 
+    __slots__ = ("_is_template", "quote")
+
     def __init__(self, value):
         """
         Creates a quoted term.
@@ -464,7 +543,7 @@ class Quote(Term):
         :type value: str
         """
         super().__init__(value[1:-1])
-        self._is_template = PLACE_HOLDER.search(value) is not None
+        self._is_template = _quote_is_template(value)
         self.quote = value[0]
 
     # noinspection PyMissingOrEmptyDocstring
@@ -484,6 +563,8 @@ class Number(Term):
     Represents a number term.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
         super().__init__(value)
 
@@ -509,6 +590,8 @@ class TemplateTerm(Term):
     based on the knowledge base.
     """
 
+    __slots__ = ("parts",)
+
     def __init__(self, parts):
         """
         Creates a template term.
@@ -533,6 +616,8 @@ class ListTerms(Term):
     Defines a term that is a list of terms.
     """
 
+    __slots__ = ("items", "_is_template")
+
     def __init__(self, terms):
         """
         Creates a list of terms.
@@ -542,6 +627,7 @@ class ListTerms(Term):
         """
         self.items = tuple(terms)
         super().__init__(f"[{', '.join(map(lambda x: str(x), self.items))}]")
+        self._is_template = any(term.is_template() for term in self.items)
 
     # noinspection PyMissingOrEmptyDocstring
     def is_constant(self):
@@ -549,21 +635,55 @@ class ListTerms(Term):
 
     # noinspection PyMissingOrEmptyDocstring
     def is_template(self):
-        for term in self.items:
-            if term.is_template():
-                return True
+        return self._is_template
 
-        return False
+
+TERM_BUILDERS = {
+    str: get_term_from_string,
+    int: Number,
+    float: Number,
+}
+"""
+Maps the exact type of an argument to the function that builds its term.
+Subclasses of these types are still handled by `build_terms`.
+"""
 
 
 class Predicate:
     """
     Represents a logic predicate.
+
+    Predicates are interned by name and arity, so building the same predicate
+    multiple times returns the same instance.
     """
 
-    def __init__(self, name, arity=0):
+    __slots__ = ("name", "arity", "_hash")
+
+    _intern = dict()
+
+    def __new__(cls, name, arity=0):
+        """
+        Creates a logic predicate, or returns the existing one with the same
+        name and arity. The predicate is initialized here, rather than in
+        `__init__`, so getting an interned predicate does not initialize it
+        again.
+
+        :param name: the name of the predicate
+        :type name: str
+        :param arity: the arity of the predicate
+        :type arity: int
+        """
+        key = (name, arity)
+        predicate = Predicate._intern.get(key)
+        if predicate is None:
+            predicate = super().__new__(cls)
+            predicate._initialize(name, arity)
+            Predicate._intern[key] = predicate
+        return predicate
+
+    def _initialize(self, name, arity):
         """
-        Creates a logic predicate.
+        Initializes the attributes of the predicate.
 
         :param name: the name of the predicate
         :type name: str
@@ -572,6 +692,10 @@ class Predicate:
         """
         self.name = name
         self.arity = arity
+        self._hash = hash((name, arity))
+
+    def __getnewargs__(self):
+        return self.name, self.arity
 
     def __lt__(self, other):
         return self.key() < other.key()
@@ -606,9 +730,11 @@ class Predicate:
         return self.name
 
     def __hash__(self):
-        return hash(self.key())
+        return self._hash
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, self.__class__):
             return self.key() == other.key()
         return False
@@ -637,15 +763,22 @@ class TemplatePredicate(Predicate):
     instantiated based on the knowledge base.
     """
 
-    def __init__(self, parts, arity=0):
+    __slots__ = ("parts",)
+
+    def __new__(cls, parts, arity=0):
         """
-        Creates a template predicate.
+        Creates a template predicate. Template predicates are not interned.
 
         :param parts: the parts of the predicate.
         :type parts: list[str]
         """
-        super().__init__("".join(parts), arity=arity)
-        self.parts = parts
+        predicate = object.__new__(cls)
+        predicate._initialize("".join(parts), arity)
+        predicate.parts = parts
+        return predicate
+
+    def __getnewargs__(self):
+        return self.parts, self.arity
 
     # noinspection PyMissingOrEmptyDocstring
     def is_template(self):
@@ -657,7 +790,9 @@ class Clause:
     Represents a logic clause.
     """
 
-    provenance: ClauseProvenance = None
+    __slots__ = ("provenance",)
+
+    provenance: ClauseProvenance
 
     def __init__(self, provenance=None):
         """
@@ -717,6 +852,9 @@ class Atom(Clause):
     Represents a logic atom.
     """
 
+    __slots__ = ("predicate", "terms", "_weight", "_hash", "_renamed_atom",
+                 "_n_vars", "_is_template")
+
     def __init__(self, predicate, *args, weight=1.0, provenance=None):
         """
         Creates a logic atom.
@@ -732,18 +870,166 @@ class Atom(Clause):
         :raise AtomMalformedException: in case the number of terms differs
         from the arity of the predicate
         """
-        super(Atom, self).__init__(provenance)
         if isinstance(predicate, Predicate):
-            self.predicate = predicate
             if predicate.arity != len(args):
                 raise AtomMalformedException(predicate.arity,
                                              len(args))
         else:
-            self.predicate = Predicate(predicate, len(args))
+            # looks up the interned predicate before calling `Predicate`
+            predicate = Predicate._intern.get((predicate, len(args))) or \
+                Predicate(predicate, len(args))
 
-        self.weight = weight
+        # the attributes are assigned here, rather than through
+        # `_initialize`, since this is the hot path to build atoms
+        self.provenance = provenance
+        self.predicate = predicate
+        self._weight = weight
         # noinspection PyTypeChecker
-        self.terms = build_terms(args)
+        self.terms = tuple(build_terms(args))
+        self._hash = None
+        self._renamed_atom = None
+        self._n_vars = None
+        self._is_template = None
+
+    @classmethod
+    def _from_validated(cls, predicate, terms, weight=1.0, provenance=None):
+        """
+        Creates an atom from a predicate and terms that are already valid,
+        skipping the validation and the building of the terms.
+
+        :param predicate: the predicate
+        :type predicate: Predicate
+        :param terms: the terms, with the same size as the predicate arity
+        :type terms: tuple[Term]
+        :param weight: the weight of the atom
+        :type weight: float
+        :param provenance: the provenance of the atom
+        :type provenance: ClauseProvenance
+        :return: the atom
+        :rtype: Atom
+        """
+        atom = cls.__new__(cls)
+        Clause.__init__(atom, provenance)
+        atom._initialize(predicate, terms, weight)
+        return atom
+
+    @classmethod
+    def _from_atom(cls, atom, weight):
+        """
+        Creates an atom with the predicate and terms of `atom`, reusing the
+        properties already computed by it.
+
+        :param atom: the atom
+        :type atom: Atom
+        :param weight: the weight of the new atom
+        :type weight: float
+        :return: the atom
+        :rtype: Atom
+        """
+        new_atom = cls.__new__(cls)
+        Clause.__init__(new_atom, None)
+        new_atom._initialize_from(atom, weight)
+        return new_atom
+
+    def _initialize_from(self, atom, weight):
+        """
+        Initializes the attributes of the atom from the predicate and terms of
+        `atom`, reusing the properties already computed by it.
+
+        :param atom: the atom
+        :type atom: Atom
+        :param weight: the weight of the atom
+        :type weight: float
+        """
+        self.predicate = atom.predicate
+        self._weight = weight
+        self.terms = atom.terms
+        self._renamed_atom = atom._renamed_atom
+        self._n_vars = atom._n_vars
+        self._is_template = atom._is_template
+        if type(atom) is Atom and atom._weight == weight:
+            # the predicate, terms and weight match, so does the hash of the
+            # atom part
+            self._hash = None if atom._hash is None else \
+                self._combine_hash(atom._hash)
+        else:
+            self._hash = None
+
+    def _initialize(self, predicate, terms, weight):
+        """
+        Initializes the attributes of the atom.
+
+        :param predicate: the predicate
+        :type predicate: Predicate
+        :param terms: the terms
+        :type terms: tuple[Term]
+        :param weight: the weight of the atom
+        :type weight: float
+        """
+        self.predicate = predicate
+        self._weight = weight
+        self.terms = terms
+        self._hash = None
+        self._renamed_atom = None
+        self._n_vars = None
+        self._is_template = None
+
+    def _compute_properties(self):
+        """
+        Computes the number of variables of the atom and whether it is a
+        template, in a single pass over the terms. The properties are
+        computed on first use, since most atoms built while loading the
+        knowledge base never need them.
+        """
+        n_vars = 0
+        is_template = self.predicate.is_template()
+        for term in self.terms:
+            if not term.is_constant():
+                n_vars += 1
+            if not is_template and term.is_template():
+                is_template = True
+        self._n_vars = n_vars
+        self._is_template = is_template
+
+    @property
+    def weight(self):
+        """
+        Gets the weight of the atom.
+
+        :return: the weight of the atom
+        :rtype: float
+        """
+        return self._weight
+
+    @weight.setter
+    def weight(self, value):
+        """
+        Sets the weight of the atom.
+
+        :param value: the weight of the atom
+        :type value: float
+        """
+        self._weight = value
+        self._clear_cached()
+
+    def _clear_cached(self):
+        """
+        Clears the cached hash of the atom, to be computed on first use. Must
+        be called whenever an attribute that composes the key changes.
+        """
+        self._hash = None
+
+    def _combine_hash(self, atom_hash):
+        """
+        Combines the hash of the predicate, terms and weight of the atom
+        with the remaining attributes of its key.
+
+        :param atom_hash: the hash of the predicate, terms and weight
+        :type atom_hash: int
+        :return: the hash of the atom
+        :rtype: int
+        """
+        return atom_hash
 
     def __getitem__(self, item):
         return self.terms[item]
@@ -765,10 +1051,9 @@ class Atom(Clause):
 
     # noinspection PyMissingOrEmptyDocstring
     def is_grounded(self):
-        for term in self.terms:
-            if isinstance(term, Term) and not term.is_constant():
-                return False
-        return True
+        if self._n_vars is None:
+            self._compute_properties()
+        return self._n_vars == 0
 
     def arity(self):
         """
@@ -786,36 +1071,35 @@ class Atom(Clause):
         :return: the number of variables in the atom
         :rtype: int
         """
-        return sum(1 for i in self.terms if not i.is_constant())
+        if self._n_vars is None:
+            self._compute_properties()
+        return self._n_vars
 
     # noinspection PyMissingOrEmptyDocstring
     def key(self):
-        return self.weight, self.predicate, tuple(self.terms)
+        return self._weight, self.predicate, self.terms
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = self._combine_hash(
+                hash((self._weight, self.predicate, self.terms)))
+        return self._hash
 
     def __repr__(self):
-        if self.terms is None or len(self.terms) == 0:
-            if self.weight == 1.0:
-                return self.predicate.name
-            else:
-                return "{}::{}".format(self.weight, self.predicate.name)
-
-        atom = "{}({})".format(self.predicate.name,
-                               ", ".join(map(lambda x: str(x), self.terms)))
-        if self.weight != 1.0:
-            return "{}{}{}".format(self.weight, WEIGHT_SEPARATOR, atom)
+        if not self.terms:
+            atom = self.predicate.name
+        else:
+            terms = ", ".join(map(str, self.terms))
+            atom = f"{self.predicate.name}({terms})"
+        if self._weight != 1.0:
+            atom = f"{self._weight}{WEIGHT_SEPARATOR}{atom}"
         return atom
 
     # noinspection PyMissingOrEmptyDocstring
     def is_template(self):
-        if self.predicate.is_template():
-            return True
-        if self.terms is None or len(self.terms) == 0:
-            return False
-        for term in self.terms:
-            if term.is_template():
-                return True
-
-        return False
+        if self._is_template is None:
+            self._compute_properties()
+        return self._is_template
 
 
 class Literal(Atom):
@@ -823,6 +1107,8 @@ class Literal(Atom):
     Represents a logic literal.
     """
 
+    __slots__ = ("negated",)
+
     def __init__(self, atom, negated=False):
         """
         Creates a logic literal from an atom.
@@ -831,12 +1117,13 @@ class Literal(Atom):
         :type atom: Atom
         :param negated: if the literal is negated
         :type negated: bool
-        :raise AtomMalformedException: in case the number of terms differs
-        from the arity of the predicate
         """
-        super().__init__(atom.predicate, *atom.terms, weight=1.0,
-                         provenance=atom.provenance)
         self.negated = negated
+        Clause.__init__(self, atom.provenance)
+        self._initialize_from(atom, 1.0)
+
+    def _combine_hash(self, atom_hash):
+        return hash((self.negated, atom_hash))
 
     # noinspection PyMissingOrEmptyDocstring
     def key(self):
@@ -856,13 +1143,15 @@ class AtomClause(Clause):
     it is written with a `END_SIGN` at the end.
     """
 
+    __slots__ = ("atom",)
+
     def __init__(self, atom):
         """
         Creates an atom clause
         :param atom: the atom
         :type atom: Atom
         """
-        self.atom = Atom(atom.predicate, *atom.terms, weight=atom.weight)
+        self.atom = Atom._from_atom(atom, atom.weight)
         super(AtomClause, self).__init__(atom.provenance)
 
     # noinspection PyMissingOrEmptyDocstring
@@ -877,6 +1166,9 @@ class AtomClause(Clause):
     def key(self):
         return self.atom.key()
 
+    def __hash__(self):
+        return hash(self.atom)
+
     def __repr__(self):
         return self.atom.__str__() + END_SIGN
 
@@ -916,6 +1208,8 @@ class HornClause(Clause):
     Represents a logic Horn clause.
     """
 
+    __slots__ = ("head", "body")
+
     def __init__(self, head, *body, provenance=None):
         """
         Creates a Horn clause.
@@ -938,11 +1232,15 @@ class HornClause(Clause):
 
     # noinspection PyMissingOrEmptyDocstring
     def key(self):
-        key_tuple = self.head.key()
-        if self.body is not None and len(self.body) > 0:
-            for literal in self.body:
-                key_tuple += literal.key()
-        return tuple(key_tuple)
+        if not self.body:
+            return self.head.key()
+        return self.head.key() + \
+            tuple(chain.from_iterable(literal.key() for literal in self.body))
+
+    def __hash__(self):
+        # the key is not cached, since the body might be changed in place;
+        # instead, the hash combines the cached hashes of the literals
+        return hash((self.head, *self.body))
 
     def __repr__(self):
         return format_horn_clause(self.head, self.body)
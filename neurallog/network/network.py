@@ -897,18 +897,20 @@ class NeuralLogNetwork(keras.Model):
                 program.add_fact(fact)
             elif rank == 1:
                 for i in range(size_0):
-                    fact = Atom(atom.predicate, *atom.terms, weight=values[i])
-                    fact.terms[variable_indices[0]] = \
+                    terms = list(atom.terms)
+                    terms[variable_indices[0]] = \
                         program.get_constant_by_index(atom.predicate, 0, i)
+                    fact = Atom(atom.predicate, *terms, weight=values[i])
                     program.add_fact(fact)
             elif rank == 2:
                 size_1 = program.get_constant_size(atom.predicate, 1)
                 for i in range(size_0):
                     for j in range(size_1):
-                        fact = Atom(atom.predicate, *atom.terms,
-                                    weight=values[i, j])
-                        fact.terms[variable_indices[0]] = \
+                        terms = list(atom.terms)
+                        terms[variable_indices[0]] = \
                             program.get_constant_by_index(atom.predicate, 0, i)
-                        fact.terms[variable_indices[1]] = \
+                        terms[variable_indices[1]] = \
                             program.get_constant_by_index(atom.predicate, 1, j)
+                        fact = Atom(atom.predicate, *terms,
+                                    weight=values[i, j])
                         program.add_fact(fact)
@@ -0,0 +1,79 @@
+#  Copyright 2021 Victor Guimarães
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Tests the knowledge base table.
+"""
+import unittest
+from unittest import mock
+
+from neurallog.knowledge import knowledge_base_table
+from neurallog.knowledge.knowledge_base_table import KnowledgeBaseTable
+from neurallog.language.language import Atom, get_substitution
+
+ATOMS = [
+    Atom("parent", "ann", "bob"),
+    Atom("parent", "bob", "bob"),
+    Atom("parent", "bob", "carl"),
+    Atom("male", "bob"),
+    Atom("male", "carl"),
+    Atom("age", "ann", 42),
+    Atom("true"),
+]
+
+
+class TestKnowledgeBaseTable(unittest.TestCase):
+
+    # noinspection PyMissingOrEmptyDocstring
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.table = KnowledgeBaseTable.to_table(ATOMS)
+
+    def assert_match(self, generic_atom):
+        expected = [atom for atom in ATOMS
+                    if get_substitution(generic_atom, atom) is not None]
+        self.assertEqual(expected, self.table.match(generic_atom))
+
+    def test_match_variables(self):
+        self.assert_match(Atom("parent", "X", "Y"))
+        self.assert_match(Atom("male", "X"))
+        self.assert_match(Atom("true"))
+
+    def test_match_constants(self):
+        self.assert_match(Atom("parent", "bob", "Y"))
+        self.assert_match(Atom("parent", "X", "carl"))
+        self.assert_match(Atom("age", "X", 42))
+        self.assert_match(Atom("male", "ann"))
+
+    def test_match_repeated_variables(self):
+        self.assert_match(Atom("parent", "X", "X"))
+
+    def test_match_unknown(self):
+        self.assertEqual([], self.table.match(Atom("parent", "X", "dave")))
+        self.assertEqual([], self.table.match(Atom("female", "X")))
+        self.assertEqual([], self.table.match(Atom("parent", "X")))
+
+    def test_match_columns(self):
+        with mock.patch.object(knowledge_base_table, "match_kernel",
+                               knowledge_base_table.match_columns):
+            self.assert_match(Atom("parent", "X", "Y"))
+            self.assert_match(Atom("parent", "bob", "Y"))
+            self.assert_match(Atom("age", "X", 42))
+            self.assert_match(Atom("parent", "X", "X"))
+            self.assert_match(Atom("true"))
+
+    def test_empty_table(self):
+        table = KnowledgeBaseTable.to_table([])
+        self.assertEqual(0, len(table))
+        self.assertEqual([], table.match(Atom("parent", "X", "Y")))
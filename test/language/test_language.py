@@ -0,0 +1,190 @@
+#  Copyright 2021 Victor Guimarães
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Tests the language classes.
+"""
+import pickle
+import unittest
+
+from neurallog.language.language import Atom, Literal, Constant, \
+    Variable, get_substitution, get_renamed_atom, AtomClause, Quote, \
+    HornClause, Predicate, TemplatePredicate
+
+
+class TestLanguage(unittest.TestCase):
+
+    def test_quote_place_holder(self):
+        cases = [
+            ("{a}", True),
+            ("{}", False),
+            ("{a", False),
+            ("{{a}", True),
+            ("a{b c}", False),
+            ("prefix_{name-1}_suffix", True),
+            ("", False),
+            ("abc", False),
+            ("a}b", False),
+        ]
+        for value, expected in cases:
+            self.assertEqual(
+                expected, Quote(f'"{value}"').is_template(), value)
+
+    def test_quote_template(self):
+        self.assertTrue(Quote('"{a}"').is_template())
+        self.assertFalse(Quote('"{a"').is_template())
+        self.assertTrue(Quote("'abc'").is_constant())
+
+    def test_atom_weight_change(self):
+        atom = Atom("parent", "ann", "bob")
+        atom.weight = 0.5
+        expected = Atom("parent", "ann", "bob", weight=0.5)
+        self.assertEqual(expected, atom)
+        self.assertEqual(hash(expected), hash(atom))
+        self.assertEqual("0.5::parent(ann, bob)", repr(atom))
+        self.assertNotEqual(Atom("parent", "ann", "bob"), atom)
+
+    def test_literal_weight_change(self):
+        literal = Literal(Atom("parent", "X", "bob"), negated=True)
+        self.assertEqual("not parent(X, bob)", repr(literal))
+        literal.weight = 0.5
+        expected = Literal(Atom("parent", "X", "bob"), negated=True)
+        expected.weight = 0.5
+        self.assertEqual(expected, literal)
+        self.assertEqual(hash(expected), hash(literal))
+        self.assertEqual("not 0.5::parent(X, bob)", repr(literal))
+        self.assertNotEqual(
+            Literal(Atom("parent", "X", "bob"), negated=True), literal)
+
+    def test_atom_properties(self):
+        atom = Atom("parent", "X", "bob", "Y", 3)
+        self.assertEqual(2, atom.get_number_of_variables())
+        self.assertFalse(atom.is_grounded())
+        self.assertFalse(atom.is_template())
+        atom = Atom("parent", "ann", '"{name}"')
+        self.assertEqual(1, atom.get_number_of_variables())
+        self.assertTrue(atom.is_template())
+        atom = Atom("parent", "ann", "bob")
+        self.assertEqual(0, atom.get_number_of_variables())
+        self.assertTrue(atom.is_grounded())
+
+    def test_literal_from_atom(self):
+        for atom in (Atom("parent", "X", "bob"),
+                     Atom("parent", "X", "bob", weight=0.5),
+                     Atom("parent", "X", '"{name}"')):
+            literal = Literal(atom, negated=True)
+            self.assertEqual(Literal(literal, negated=True), literal)
+            self.assertEqual(hash(Literal(literal, negated=True)),
+                             hash(literal))
+            self.assertEqual(1.0, literal.weight)
+            self.assertEqual(atom.terms, literal.terms)
+            self.assertEqual(atom.is_template(), literal.is_template())
+            self.assertEqual(atom.get_number_of_variables(),
+                             literal.get_number_of_variables())
+            self.assertNotEqual(hash(Literal(atom)), hash(literal))
+
+    def test_atom_clause_from_atom(self):
+        atom = Atom("parent", "ann", "bob", weight=0.5)
+        repr(atom)
+        clause = AtomClause(atom)
+        self.assertEqual(atom, clause.atom)
+        self.assertEqual(hash(atom), hash(clause))
+        self.assertEqual("0.5::parent(ann, bob).", repr(clause))
+        self.assertTrue(clause.is_grounded())
+        clause.atom.weight = 0.2
+        self.assertEqual(0.5, atom.weight)
+        self.assertEqual("0.2::parent(ann, bob).", repr(clause))
+
+    def test_substitution(self):
+        generic_atom = Atom("parent", "X", "Y")
+        specific_atom = Atom("parent", "ann", "bob")
+        expected = {Variable("X"): Constant("ann"),
+                    Variable("Y"): Constant("bob")}
+        self.assertEqual(
+            expected, get_substitution(generic_atom, specific_atom))
+
+    def test_substitution_failure(self):
+        self.assertIsNone(get_substitution(
+            Atom("parent", "X", "X"), Atom("parent", "ann", "bob")))
+        self.assertIsNone(get_substitution(
+            Atom("parent", "X", "Y"), Atom("male", "ann")))
+
+    def test_substitution_number_types(self):
+        generic_atom = Atom("age", "X", "Y")
+        float_atom = Atom("age", "ann", 1.0)
+        int_atom = Atom("age", "ann", 1)
+        self.assertIsInstance(
+            get_substitution(generic_atom, float_atom)[Variable("Y")].value,
+            float)
+        self.assertIsInstance(
+            get_substitution(generic_atom, int_atom)[Variable("Y")].value,
+            int)
+
+    def test_renamed_atom_cache(self):
+        atom = Atom("parent", "A", "bob", "A", "C")
+        expected = Atom("parent", "X0", "bob", "X0", "X1")
+        self.assertEqual(expected, get_renamed_atom(atom))
+        self.assertEqual(
+            expected, get_renamed_atom(Atom("parent", "A", "bob", "A", "C")))
+        self.assertIs(get_renamed_atom(atom), get_renamed_atom(atom))
+
+    def test_renamed_atom_number_types(self):
+        self.assertEqual(
+            "age(X0, 1.0)", str(get_renamed_atom(Atom("age", "X", 1.0))))
+        self.assertEqual(
+            "age(X0, 1)", str(get_renamed_atom(Atom("age", "X", 1))))
+
+    def test_renamed_atom_after_weight_change(self):
+        atom = Atom("parent", "A", "bob")
+        expected = Atom("parent", "X0", "bob")
+        self.assertEqual(expected, get_renamed_atom(atom))
+        atom.weight = 0.5
+        renamed_atom = get_renamed_atom(atom)
+        self.assertEqual(expected, renamed_atom)
+        self.assertEqual(1.0, renamed_atom.weight)
+
+    def test_horn_clause_hash(self):
+        def build_clause(*body):
+            return HornClause(Atom("grandparent", "X", "Z"),
+                              *map(lambda x: Literal(Atom("parent", *x)),
+                                   body))
+
+        clause = build_clause(("X", "Y"), ("Y", "Z"))
+        other = build_clause(("X", "Y"), ("Y", "Z"))
+        self.assertEqual(other, clause)
+        self.assertEqual(hash(other), hash(clause))
+        self.assertEqual(
+            clause.head.key() + clause.body[0].key() + clause.body[1].key(),
+            clause.key())
+
+        clause.body.append(Literal(Atom("parent", "Z", "W")))
+        self.assertNotEqual(other, clause)
+        expected = build_clause(("X", "Y"), ("Y", "Z"), ("Z", "W"))
+        self.assertEqual(expected, clause)
+        self.assertEqual(hash(expected), hash(clause))
+
+        clause.body.remove(Literal(Atom("parent", "Z", "W")))
+        self.assertEqual(other, clause)
+        self.assertEqual(hash(other), hash(clause))
+
+    def test_predicate_interning(self):
+        predicate = Predicate("parent", 2)
+        self.assertIs(predicate, Predicate("parent", 2))
+        self.assertIs(predicate, Atom("parent", "ann", "bob").predicate)
+        self.assertIsNot(predicate, Predicate("parent", 3))
+        self.assertIs(predicate, pickle.loads(pickle.dumps(predicate)))
+        template = TemplatePredicate(["parent", "{x}"], 2)
+        self.assertIsNot(template, TemplatePredicate(["parent", "{x}"], 2))
+        self.assertEqual(template,
+                         pickle.loads(pickle.dumps(template)))
@@ -106,3 +106,15 @@ class TestNetworkTraining(unittest.TestCase):
                 0.0 <= example.weight <= 1.0,
                 "Fact {} outside the constraint range of [0, 1]".format(
                     example.weight))
+
+    def test_update_program_terms(self):
+        self.model.update_program()
+        predicate = Predicate("father", 2)
+        expected = set()
+        for i in range(self.program.get_constant_size(predicate, 0)):
+            for j in range(self.program.get_constant_size(predicate, 1)):
+                expected.add(
+                    (self.program.get_constant_by_index(predicate, 0, i),
+                     self.program.get_constant_by_index(predicate, 1, j)))
+        facts = self.program.facts_by_predicate.get(predicate).values()
+        self.assertEqual(expected, set(map(lambda x: x.terms, facts)))